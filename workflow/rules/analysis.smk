@@ -4,7 +4,7 @@ Analysis and visualization rules: compute statistics and generate outputs.
 
 rule run_analysis:
     input:
-        "data/cleaned_data.csv"
+        f"data/cleaned_data.{INTERMEDIATE_FORMAT}"
     output:
         "results/analysis_output.txt"
     conda:
@@ -0,0 +1,27 @@
+"""
+Fused preprocessing and analysis rule: one pass over the raw data, cleaned rows held in memory.
+Enabled with `fuse_steps: true` in config/config.yaml.
+"""
+
+ruleorder: fused_pipeline > run_analysis
+
+rule fused_pipeline:
+    input:
+        "data/raw_data.csv"
+    output:
+        "results/analysis_output.txt"
+    conda:
+        "../envs/smk-ex.yaml"
+    params:
+        delimiter=config["workflow"]["preprocess_delimiter"]
+    resources:
+        mem_mb=1024,
+        runtime=15,
+        cpus_per_task=1
+    threads: 1
+    log:
+        "logs/fused_pipeline.log"
+    message:
+        "Preprocessing, cleaning and analyzing {input} in a single pass"
+    shell:
+        "python workflow/scripts/helpers.py pipeline --input {input} --analysis-output {output} --delimiter {params.delimiter} > {log} 2>&1"
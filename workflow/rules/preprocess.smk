@@ -6,11 +6,13 @@ rule preprocess_data:
     input:
         "data/raw_data.csv"
     output:
-        "data/processed_data.csv"
+        f"data/processed_data.{INTERMEDIATE_FORMAT}"
     conda:
         "../envs/smk-ex.yaml"
     params:
-        delimiter=config["workflow"]["preprocess_delimiter"]
+        delimiter=config["workflow"]["preprocess_delimiter"],
+        fmt=INTERMEDIATE_FORMAT,
+        engine=config["workflow"].get("preprocess_engine", "sync")
     resources:
         mem_mb=512,
         runtime=5,
@@ -21,14 +23,14 @@ rule preprocess_data:
     message:
         "Preprocessing raw data from {input}"
     shell:
-        "python workflow/scripts/helpers.py preprocess --input {input} --output {output} --delimiter {params.delimiter} > {log} 2>&1"
+        "python workflow/scripts/helpers.py preprocess --input {input} --output {output} --delimiter {params.delimiter} --format {params.fmt} --engine {params.engine} > {log} 2>&1"
 
 
 rule clean_data:
     input:
-        "data/processed_data.csv"
+        f"data/processed_data.{INTERMEDIATE_FORMAT}"
     output:
-        "data/cleaned_data.csv"
+        f"data/cleaned_data.{INTERMEDIATE_FORMAT}"
     conda:
         "../envs/smk-ex.yaml"
     resources:
@@ -1,9 +1,25 @@
 import argparse
+import contextlib
 import csv
+import io
 import os
+import queue
 import sys
+import threading
 import logging
 from collections import Counter
+from collections.abc import Iterable, Iterator
+
+try:
+    from xxhash import xxh3_64_intdigest as fingerprint
+except ImportError:  # xxhash is optional; the builtin hash is also 64-bit
+    fingerprint = hash
+
+# Categorical columns tallied by run-analysis
+CATEGORY_COLUMNS = ("disease", "outcome", "vaccination_status")
+
+# Totals from the analysis output that summarize turns into rates
+SUMMARY_STATS = frozenset({"total_cases", "hospitalized", "deaths"})
 
 # Setup logging to capture in Snakemake logs
 logging.basicConfig(
@@ -13,10 +29,141 @@ logging.basicConfig(
 )
 
 
-def preprocess(input_path: str, output_path: str, delimiter: str = ",") -> None:
-    """Preprocess CSV: remove blank rows, keep header and valid data rows."""
-    logging.info(f"Starting preprocessing of {input_path}")
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+def is_feather(path: str) -> bool:
+    """Intermediate files are Feather (Arrow IPC) when named *.feather, CSV otherwise."""
+    return path.endswith(".feather")
+
+
+def write_feather(table, path: str) -> None:
+    """Write an intermediate Feather file that later steps can memory-map without copying.
+
+    Categorical columns are stored dictionary-encoded with one shared dictionary,
+    and the file is left uncompressed because compressed buffers must be
+    decoded into memory on read.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.feather as feather
+
+    # By position, so a header that repeats a category name still gets every copy encoded
+    for i, field in enumerate(table.schema):
+        if field.name in CATEGORY_COLUMNS and not pa.types.is_dictionary(field.type):
+            table = table.set_column(i, field.name, pc.dictionary_encode(table.column(i).combine_chunks()))
+    feather.write_feather(table, path, compression="uncompressed", chunksize=1 << 16)
+
+
+def arrow_read_options(**kwargs):
+    """Multi-threaded Arrow CSV read options; SNAKE_ARROW_BLOCK overrides the block size in bytes."""
+    import pyarrow.csv as pa_csv
+
+    block_size = int(os.environ.get("SNAKE_ARROW_BLOCK", 16 << 20))
+    return pa_csv.ReadOptions(use_threads=True, block_size=block_size, **kwargs)
+
+
+class ChunkedWriter:
+    """Binary output file that collects writes in a bytearray and flushes them about once per MiB."""
+
+    def __init__(self, path: str, flush_size: int = 1 << 20) -> None:
+        self.fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        self.flush_size = flush_size
+        self.buf = bytearray()
+
+    def __enter__(self) -> "ChunkedWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        try:
+            self.flush()
+        finally:
+            os.close(self.fd)
+
+    def write(self, data: bytes) -> None:
+        self.buf += data
+        if len(self.buf) >= self.flush_size:
+            self.flush()
+
+    def flush(self) -> None:
+        written = 0
+        with memoryview(self.buf) as view:
+            while written < len(view):
+                written += os.write(self.fd, view[written:])
+        self.buf.clear()
+
+
+def blank_row_bytes(delimiter: str) -> bytes:
+    """Bytes that cannot make an unquoted line non-blank: the delimiter and the ASCII whitespace str.strip() removes."""
+    return delimiter.encode() + b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
+
+def blank_cells(text: str, delimiter: str) -> bool:
+    """The csv-module blank test: no cell of the row has anything left after strip()."""
+    return not any(cell.strip() for cell in next(csv.reader([text], delimiter=delimiter), []))
+
+
+def has_bare_cr(path: str, block_size: int = 1 << 20) -> bool:
+    """Whether a file has a carriage return outside a CRLF pair.
+
+    Byte-level line splitting only breaks at LF, while the csv module also ends
+    a row at a lone CR, so such files must go through the csv module.
+    """
+    with open(path, "rb") as f:
+        tail = b""
+        while block := f.read(block_size):
+            block = tail + block
+            # A CR at the end of a block may pair with an LF at the start of the next one
+            tail = block[-1:] if block.endswith(b"\r") else b""
+            body = block[: len(block) - len(tail)]
+            if b"\r" in body and body.count(b"\r") != body.count(b"\r\n"):
+                return True
+    return tail == b"\r"
+
+
+def keep_line(line: bytes, inside: bool, delimiter: str) -> tuple[bool, bool]:
+    """Exact blank test for a line the byte-level check cannot decide.
+
+    Returns whether to keep the line and whether a quoted field is still open
+    after it. Every line of a record that spans lines is kept, so a blank line
+    inside a quoted field is never removed.
+    """
+    open_after = inside != (line.count(b'"') % 2 == 1)
+    if inside or open_after:
+        return True, open_after
+    return not blank_cells(line.decode(errors="replace"), delimiter), False
+
+
+def _preprocess_bytes(input_path: str, output_path: str, delimiter: str, engine: str) -> tuple[int, int]:
+    """Copy non-blank lines byte-for-byte.
+
+    The delimiter byte is baked into a deletion table once, so for a line that
+    is plain ASCII without quotes the blank test is a single translate call:
+    the line is blank exactly when nothing is left. Lines with quotes or other
+    bytes go through keep_line(), which applies the csv-module test.
+    """
+    drop = blank_row_bytes(delimiter)
+    rows_read = 0
+    rows_written = 0
+    with contextlib.ExitStack() as stack:
+        if engine == "prefetch":
+            lines = split_lines(stack.enter_context(contextlib.closing(prefetch_blocks(input_path))))
+        else:
+            lines = terminated_lines(stack.enter_context(open(input_path, "rb", buffering=1 << 20)))
+        out_f = stack.enter_context(ChunkedWriter(output_path))
+        inside = False
+        for line in lines:
+            rows_read += 1
+            rest = line.translate(None, drop)
+            if inside or b'"' in rest or not rest.isascii():
+                keep, inside = keep_line(line, inside, delimiter)
+            else:
+                keep = rest
+            if keep:
+                out_f.write(line)
+                rows_written += 1
+    return rows_read, rows_written
+
+
+def _preprocess_csv(input_path: str, output_path: str, delimiter: str) -> tuple[int, int]:
+    """Drop blank rows row-by-row with the csv module (used for multi-byte delimiters and lone-CR line ends)."""
     with open(input_path, newline="") as in_f, open(output_path, "w", newline="") as out_f:
         reader = csv.reader(in_f, delimiter=delimiter)
         writer = csv.writer(out_f, delimiter=delimiter)
@@ -28,63 +175,487 @@ def preprocess(input_path: str, output_path: str, delimiter: str = ",") -> None:
             if any(cell.strip() for cell in row):
                 writer.writerow(row)
                 rows_written += 1
+    return rows_read, rows_written
+
+
+def _preprocess_feather(input_path: str, output_path: str, delimiter: str) -> tuple[int, int]:
+    """Drop blank rows batch-by-batch with pyarrow's streaming CSV reader and write Feather."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+
+    # The header is the first non-blank row, as in the CSV output; the csv module's names
+    # (a BOM included) are handed to Arrow so both read the same columns
+    with open(input_path, newline="") as in_f:
+        rows = csv.reader(in_f, delimiter=delimiter)
+        header = []
+        leading = 0
+        for row in rows:
+            if any(cell.strip() for cell in row):
+                header = row
+                break
+            leading += 1
+        header_lines = rows.line_num
+    if not header:
+        write_feather(pa.table({}), output_path)
+        return leading, 0
+
+    skipped = 0
+    invalid = None
+
+    def check_invalid_row(row):
+        # Rows with the wrong column count cannot go into the table; blank ones are dropped
+        # like any other blank row, anything else stops the run
+        nonlocal skipped, invalid
+        if blank_cells(row.text, delimiter):
+            skipped += 1
+            return "skip"
+        invalid = row
+        return "error"
+
+    rows_read = leading + 1
+    rows_written = 1
+
+    def non_blank_batches(reader):
+        nonlocal rows_read, rows_written
+        for batch in reader:
+            rows_read += batch.num_rows
+            # A row is kept if any of its cells is non-blank after trimming
+            keep = None
+            for column in batch.columns:
+                non_blank = pc.not_equal(pc.utf8_trim_whitespace(column), "")
+                keep = non_blank if keep is None else pc.or_(keep, non_blank)
+            batch = batch.filter(keep)
+            rows_written += batch.num_rows
+            yield batch
+
+    try:
+        # Read every column as text so values are stored exactly as they appear
+        reader = pa_csv.open_csv(
+            input_path,
+            read_options=arrow_read_options(column_names=header, skip_rows=header_lines),
+            parse_options=pa_csv.ParseOptions(
+                delimiter=delimiter, invalid_row_handler=check_invalid_row
+            ),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in header}, strings_can_be_null=False
+            ),
+        )
+        table = pa.Table.from_batches(non_blank_batches(reader), schema=reader.schema)
+    except pa.ArrowInvalid as exc:
+        if invalid is None:
+            raise
+        raise ValueError(
+            f"{input_path}: a row has {invalid.actual_columns} fields but the header has "
+            f"{invalid.expected_columns}: {invalid.text!r}; Feather tables cannot hold it, "
+            "use --format csv to keep such rows"
+        ) from exc
+    write_feather(table, output_path)
+    return rows_read + skipped, rows_written
+
+
+def preprocess(
+    input_path: str, output_path: str, delimiter: str = ",", fmt: str = "csv", engine: str = "sync"
+) -> None:
+    """Preprocess CSV: remove blank rows, keep header and valid data rows.
+
+    CSV output is a byte-level copy of the non-blank lines; engine="prefetch"
+    reads the input on a background thread so reads overlap the filtering.
+    With fmt="feather" the result is written with write_feather(), which
+    requires pyarrow.
+    """
+    logging.info(f"Starting preprocessing of {input_path}")
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    if fmt == "feather":
+        rows_read, rows_written = _preprocess_feather(input_path, output_path, delimiter)
+    elif len(delimiter.encode()) == 1 and not has_bare_cr(input_path):
+        rows_read, rows_written = _preprocess_bytes(input_path, output_path, delimiter, engine)
+    else:
+        rows_read, rows_written = _preprocess_csv(input_path, output_path, delimiter)
     logging.info(f"Preprocessing complete: {rows_read} rows read, {rows_written} rows written to {output_path}")
 
 
+def terminated_lines(f) -> Iterable[bytes]:
+    """Lines of a seekable binary file, with a newline added to an unterminated last line.
+
+    Only the final line can lack a terminator, so the last byte is checked once
+    and files that already end in a newline are iterated directly.
+    """
+    end = f.seek(0, os.SEEK_END)
+    f.seek(max(end - 1, 0))
+    last = f.read(1)
+    f.seek(0)
+    if last in (b"", b"\n"):
+        return f
+    return (line if line.endswith(b"\n") else line + b"\n" for line in f)
+
+
+def prefetch_blocks(path: str, block_size: int = 4 << 20) -> Iterator[bytes]:
+    """Yield a file block by block while a background thread reads the next block.
+
+    File reads release the GIL, so reading block N+1 overlaps with the caller's
+    work on block N (double buffering). An exception in the reader thread is
+    re-raised here, and closing the generator early stops the thread and
+    closes the file.
+    """
+    blocks = queue.Queue(maxsize=1)
+    stop = threading.Event()
+
+    def send(item) -> bool:
+        # Wake up now and then to see whether the consumer has gone away
+        while not stop.is_set():
+            try:
+                blocks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def read_blocks():
+        end = b""
+        try:
+            with open(path, "rb", buffering=0) as f:
+                while block := f.read(block_size):
+                    if not send(block):
+                        return
+        except BaseException as exc:
+            end = exc
+        finally:
+            # The end marker (or the exception) is always queued, so the consumer never waits forever
+            send(end)
+
+    reader = threading.Thread(target=read_blocks, daemon=True)
+    reader.start()
+    try:
+        while True:
+            block = blocks.get()
+            if isinstance(block, BaseException):
+                raise block
+            if not block:
+                return
+            yield block
+    finally:
+        stop.set()
+        reader.join()
+
+
+def split_lines(blocks: Iterable[bytes]) -> Iterator[bytes]:
+    """Re-split a stream of byte blocks into lines, newline included (an unterminated last line gets one)."""
+    tail = b""
+    for block in blocks:
+        buf = tail + block
+        cut = buf.rfind(b"\n") + 1
+        tail = buf[cut:]
+        # Iterating a BytesIO splits on b"\n" in C, like iterating the file itself
+        yield from io.BytesIO(buf[:cut])
+    if tail:
+        yield tail + b"\n"
+
+
+def _clean_feather(input_path: str, output_path: str) -> tuple[int, int]:
+    """Drop duplicate rows of a Feather table, keeping first occurrences in order."""
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.feather as feather
+
+    table = feather.read_table(input_path, memory_map=True)
+    if table.num_columns == 0:
+        write_feather(table, output_path)
+        return 0, 0
+
+    def column_codes(column):
+        if pa.types.is_dictionary(column.type):
+            column = column.unify_dictionaries().combine_chunks()
+        else:
+            # One encode of the combined column is cheaper than one per chunk plus unifying them
+            column = pc.dictionary_encode(column.combine_chunks())
+        size = len(column.dictionary)
+        # Nulls take the code just past the dictionary
+        return pc.fill_null(column.indices, size).to_numpy().astype(np.int64), size + 1
+
+    def renumber(key):
+        # Dictionary codes are numbered by first appearance
+        return pc.dictionary_encode(pa.array(key)).indices.to_numpy()
+
+    # Two rows are equal exactly when every column has the same dictionary code, so the codes are
+    # folded into one integer row key. bound is one past the largest possible key; the key is
+    # renumbered to below the row count only when the next key * size + codes could overflow
+    key = np.zeros(table.num_rows, dtype=np.int64)
+    bound = 1
+    for column in table.columns:
+        codes, size = column_codes(column)
+        if bound * size > 1 << 63:
+            key = renumber(key).astype(np.int64)
+            bound = table.num_rows
+        key = key * size + codes
+        bound *= size
+    # With codes in order of first appearance, a row is the first of its kind exactly when its
+    # code is larger than every code before it
+    seen = np.maximum.accumulate(renumber(key))
+    first = np.flatnonzero(np.diff(seen, prepend=-1))
+    unique = table.take(first)
+    write_feather(unique, output_path)
+    return table.num_rows, unique.num_rows
+
+
 def clean(input_path: str, output_path: str) -> None:
     """Clean CSV: remove duplicate rows while preserving order and header."""
     logging.info(f"Starting cleaning of {input_path}")
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    seen = set()
+    if is_feather(input_path):
+        rows_read, rows_written = _clean_feather(input_path, output_path)
+        logging.info(f"Cleaning complete: {rows_read} rows read, {rows_written} unique rows written to {output_path}")
+        return
     rows_read = 0
     rows_written = 0
-    with open(input_path) as in_f, open(output_path, "w") as out_f:
-        for line in in_f:
+    # Lines are remembered only by their 64-bit fingerprint; with n distinct lines the chance
+    # that two of them collide is about n**2 / 2**65
+    seen = set()
+    with open(input_path, "rb", buffering=1 << 20) as in_f, ChunkedWriter(output_path) as out_f:
+        for line in terminated_lines(in_f):
             rows_read += 1
-            if line not in seen:
-                seen.add(line)
+            h = fingerprint(line)
+            if h not in seen:
+                seen.add(h)
                 out_f.write(line)
                 rows_written += 1
     logging.info(f"Cleaning complete: {rows_read} rows read, {rows_written} unique rows written to {output_path}")
 
 
+def tally_cases(reader) -> tuple:
+    """Count cases from a csv.reader in one streaming pass; no row is kept after it is counted."""
+    header = next(reader, [])
+    # Later duplicates win, as in csv.DictReader
+    positions = {name: i for i, name in enumerate(header)}
+    columns = tuple(positions.get(name) for name in CATEGORY_COLUMNS)
+    di, oi, vi = columns
+    width = max(columns) + 1 if None not in columns else float("inf")
+
+    def padded(row):
+        # Same values DictReader gives: "" for a column the header lacks, None past the end of a short row
+        return ("" if i is None else row[i] if i < len(row) else None for i in columns)
+
+    total_cases = 0
+    hospitalized = 0
+    deaths = 0
+    disease_counts = Counter()
+    outcome_counts = Counter()
+    vax_counts = Counter()
+    for row in reader:
+        if len(row) >= width:
+            disease, outcome, vax = row[di], row[oi], row[vi]
+        elif not row:
+            continue  # DictReader skips rows with no fields at all
+        else:
+            disease, outcome, vax = padded(row)
+        total_cases += 1
+        disease_counts[disease] += 1
+        outcome_counts[outcome] += 1
+        vax_counts[vax] += 1
+        if outcome == "Hospitalized":
+            hospitalized += 1
+        elif outcome == "Death":
+            deaths += 1
+    return (
+        total_cases, hospitalized, deaths,
+        disease_counts.most_common(), outcome_counts.most_common(), vax_counts.most_common(),
+    )
+
+
+def csv_text(source: str | bytes) -> io.TextIOBase:
+    """Text stream over a CSV file path or in-memory CSV bytes, with newline="" as the csv module expects."""
+    if isinstance(source, str):
+        return open(source, newline="")
+    return io.TextIOWrapper(io.BytesIO(source), newline="")
+
+
+def _analyze_csv(source: str | bytes, delimiter: str = ",") -> tuple:
+    """Count cases with the csv module (used when pyarrow is missing)."""
+    with csv_text(source) as f:
+        results = tally_cases(csv.reader(f, delimiter=delimiter))
+    logging.info(f"Loaded {results[0]} cases")
+    return results
+
+
+def _analyze_arrow(source: str | bytes, delimiter: str = ",") -> tuple:
+    """Count cases by dictionary-encoding the categorical columns and histogramming the codes.
+
+    source is a file path or, for the fused pipeline, the cleaned CSV bytes.
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.feather as feather
+
+    if isinstance(source, str) and is_feather(source):
+        # Feather intermediates are uncompressed, so mapping every column costs nothing until it is read;
+        # an empty raw input gives a table without columns, whose counts then come out as zero
+        table = feather.read_table(source, memory_map=True)
+        # Select by position; a repeated header name resolves to its last copy, as in csv.DictReader
+        positions = {name: i for i, name in enumerate(table.column_names)}
+        table = table.select([positions[name] for name in CATEGORY_COLUMNS if name in positions])
+    else:
+        with csv_text(source) as f:
+            header = next(csv.reader(f, delimiter=delimiter), None)
+        if header is None:
+            logging.info("Loaded 0 cases")
+            return 0, 0, 0, [], [], []
+        present = [name for name in CATEGORY_COLUMNS if name in header]
+        if not header or any(header.count(name) > 1 for name in present):
+            # A blank or ambiguous header is resolved the way csv.DictReader does it
+            return _analyze_csv(source, delimiter)
+        malformed = False
+
+        def flag_invalid_row(row):
+            nonlocal malformed
+            malformed = True
+            return "skip"
+
+        table = pa_csv.read_csv(
+            source if isinstance(source, str) else pa.BufferReader(pa.py_buffer(source)),
+            read_options=arrow_read_options(),
+            parse_options=pa_csv.ParseOptions(delimiter=delimiter, invalid_row_handler=flag_invalid_row),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=present,
+                column_types={name: pa.string() for name in present},
+                strings_can_be_null=False,
+            ),
+        )
+        if malformed:
+            # Short and long rows still count as cases; only the csv module pads them like the header
+            return _analyze_csv(source, delimiter)
+    logging.info(f"Loaded {table.num_rows} cases")
+
+    def ranked(name):
+        if name not in table.column_names:
+            # A missing column reads as "" in every row, as with DictReader.get(name, "")
+            return [("", table.num_rows)] if table.num_rows else []
+        column = table[name]
+        # Feather columns arrive dictionary-encoded; counting chunk by chunk avoids concatenating them
+        if not pa.types.is_dictionary(column.type):
+            column = pc.dictionary_encode(column)
+        column = column.unify_dictionaries()
+        if column.num_chunks == 0:
+            return []
+        dictionary = column.chunk(0).dictionary
+        counts = sum(np.bincount(chunk.indices.to_numpy(), minlength=len(dictionary)) for chunk in column.chunks)
+        labels = dictionary.to_pylist()
+        # Dictionary codes follow first appearance, so the stable sort breaks ties like Counter
+        order = np.argsort(-counts, kind="stable")
+        return [(labels[j], int(counts[j])) for j in order]
+
+    by_outcome = ranked("outcome")
+    outcome_counts = dict(by_outcome)
+    return (
+        table.num_rows, outcome_counts.get("Hospitalized", 0), outcome_counts.get("Death", 0),
+        ranked("disease"), by_outcome, ranked("vaccination_status"),
+    )
+
+
 def run_analysis(input_path: str, output_path: str) -> None:
     """Analyze surveillance data: compute case counts, outcomes, vaccination status."""
     logging.info(f"Starting analysis of {input_path}")
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    
-    cases = []
-    with open(input_path, newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            cases.append(row)
-    
-    logging.info(f"Loaded {len(cases)} cases")
-    total_cases = len(cases)
-    disease_counts = Counter(c.get("disease", "") for c in cases)
-    outcome_counts = Counter(c.get("outcome", "") for c in cases)
-    vax_counts = Counter(c.get("vaccination_status", "") for c in cases)
-    
-    hospitalized = sum(1 for c in cases if c.get("outcome") == "Hospitalized")
-    deaths = sum(1 for c in cases if c.get("outcome") == "Death")
-    
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        if is_feather(input_path):
+            raise
+        results = _analyze_csv(input_path)
+    else:
+        results = _analyze_arrow(input_path)
+    _, hospitalized, deaths, *_ = results
     logging.info(f"Analysis results: {hospitalized} hospitalized, {deaths} deaths")
-    
+    write_analysis(output_path, *results)
+    logging.info(f"Analysis output written to {output_path}")
+
+
+def write_analysis(
+    output_path: str,
+    total_cases: int,
+    hospitalized: int,
+    deaths: int,
+    by_disease: Iterable[tuple[str, int]],
+    by_outcome: Iterable[tuple[str, int]],
+    by_vaccination: Iterable[tuple[str, int]],
+) -> None:
+    """Write analysis counts; each by_* argument is a sequence of (label, count) pairs."""
     with open(output_path, "w") as out_f:
         out_f.write(f"total_cases\t{total_cases}\n")
         out_f.write(f"hospitalized\t{hospitalized}\n")
         out_f.write(f"deaths\t{deaths}\n")
         out_f.write("\nby_disease\n")
-        for disease, count in disease_counts.most_common():
+        for disease, count in by_disease:
             out_f.write(f"  {disease}\t{count}\n")
         out_f.write("\nby_outcome\n")
-        for outcome, count in outcome_counts.most_common():
+        for outcome, count in by_outcome:
             out_f.write(f"  {outcome}\t{count}\n")
         out_f.write("\nby_vaccination\n")
-        for vax, count in vax_counts.most_common():
+        for vax, count in by_vaccination:
             out_f.write(f"  {vax}\t{count}\n")
-    
-    logging.info(f"Analysis output written to {output_path}")
+
+
+def pipeline(input_path: str, analysis_output_path: str, clean_output_path: str | None = None, delimiter: str = ",") -> None:
+    """Preprocess, clean and analyze raw CSV with one pass over the input.
+
+    The non-blank unique lines are collected in memory and counted like
+    run-analysis counts a file: with Arrow when pyarrow is installed, with
+    the csv module otherwise.
+    """
+    logging.info(f"Starting fused pipeline on {input_path}")
+    os.makedirs(os.path.dirname(analysis_output_path), exist_ok=True)
+    if clean_output_path:
+        os.makedirs(os.path.dirname(clean_output_path), exist_ok=True)
+    drop = blank_row_bytes(delimiter)
+    rows_read = 0
+    kept = bytearray()
+
+    def rewritten_rows(in_f):
+        # Lone-CR line ends: each row is rewritten by csv.writer, as the csv-module preprocess does
+        buf = io.StringIO()
+        writer = csv.writer(buf, delimiter=delimiter)
+        for row in csv.reader(io.TextIOWrapper(in_f, newline=""), delimiter=delimiter):
+            writer.writerow(row)
+            yield buf.getvalue().encode()
+            buf.seek(0)
+            buf.truncate()
+
+    with open(input_path, "rb", buffering=1 << 20) as in_f:
+        lines = rewritten_rows(in_f) if has_bare_cr(input_path) else terminated_lines(in_f)
+        seen = set()  # fingerprints, as in clean()
+        inside = False
+        for line in lines:
+            rows_read += 1
+            # Same blank test as _preprocess_bytes
+            rest = line.translate(None, drop)
+            if inside or b'"' in rest or not rest.isascii():
+                keep, inside = keep_line(line, inside, delimiter)
+                if not keep:
+                    continue
+            elif not rest:
+                continue
+            h = fingerprint(line)
+            if h not in seen:
+                seen.add(h)
+                kept += line
+        rows_written = len(seen)
+    if clean_output_path:
+        with ChunkedWriter(clean_output_path) as out_f:
+            out_f.write(kept)
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        results = _analyze_csv(kept, delimiter)
+    else:
+        results = _analyze_arrow(kept, delimiter)
+    _, hospitalized, deaths, *_ = results
+    logging.info(f"Read {rows_read} rows, kept {rows_written} non-blank unique rows")
+    logging.info(f"Analysis results: {hospitalized} hospitalized, {deaths} deaths")
+    write_analysis(analysis_output_path, *results)
+    logging.info(f"Analysis output written to {analysis_output_path}")
 
 
 def summarize(input_path: str, output_path: str) -> None:
@@ -98,7 +669,7 @@ def summarize(input_path: str, output_path: str) -> None:
             parts = line.rstrip("\n").split("\t")
             if len(parts) >= 2:
                 key, val_str = parts[0], parts[1]
-                if key in ["total_cases", "hospitalized", "deaths"]:
+                if key in SUMMARY_STATS:
                     try:
                         stats[key] = int(val_str)
                     except ValueError:
@@ -129,7 +700,9 @@ def visualize(input_path: str, output_path: str) -> None:
     logging.info(f"Starting visualization of {input_path}")
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-    import matplotlib.pyplot as plt
+    # Draw on an Agg canvas directly: no pyplot state machine or GUI backend probing
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
 
     metrics = {}
     with open(input_path) as in_f:
@@ -141,7 +714,9 @@ def visualize(input_path: str, output_path: str) -> None:
                 except (ValueError, TypeError):
                     pass
 
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(10, 8))
+    fig = Figure(figsize=(10, 8))
+    FigureCanvasAgg(fig)
+    ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
     fig.suptitle("Disease Surveillance Summary", fontsize=14, fontweight="bold")
 
     # Case counts
@@ -182,9 +757,8 @@ def visualize(input_path: str, output_path: str) -> None:
     ax4.axis("off")
     ax4.set_title("Epidemic Metrics")
 
-    plt.tight_layout()
+    fig.tight_layout()
     fig.savefig(output_path, dpi=100)
-    plt.close(fig)
     
     logging.info(f"Visualization saved to {output_path}")
 
@@ -197,6 +771,9 @@ def main() -> None:
     p_pre.add_argument("--input", required=True)
     p_pre.add_argument("--output", required=True)
     p_pre.add_argument("--delimiter", default=",")
+    p_pre.add_argument("--format", choices=["csv", "feather"], default="csv")
+    p_pre.add_argument("--engine", choices=["sync", "prefetch"], default="sync",
+                       help="Read strategy for single-byte-delimiter CSV output")
 
     p_clean = subparsers.add_parser("clean", help="Clean processed data")
     p_clean.add_argument("--input", required=True)
@@ -206,6 +783,12 @@ def main() -> None:
     p_run.add_argument("--input", required=True)
     p_run.add_argument("--output", required=True)
 
+    p_pipe = subparsers.add_parser("pipeline", help="Preprocess, clean and analyze in one pass")
+    p_pipe.add_argument("--input", required=True)
+    p_pipe.add_argument("--analysis-output", required=True)
+    p_pipe.add_argument("--clean-output")
+    p_pipe.add_argument("--delimiter", default=",")
+
     p_sum = subparsers.add_parser("summarize", help="Summarize analysis output")
     p_sum.add_argument("--input", required=True)
     p_sum.add_argument("--output", required=True)
@@ -217,11 +800,13 @@ def main() -> None:
     args = parser.parse_args()
 
     if args.command == "preprocess":
-        preprocess(args.input, args.output, args.delimiter)
+        preprocess(args.input, args.output, args.delimiter, args.format, args.engine)
     elif args.command == "clean":
         clean(args.input, args.output)
     elif args.command == "run-analysis":
         run_analysis(args.input, args.output)
+    elif args.command == "pipeline":
+        pipeline(args.input, args.analysis_output, args.clean_output, args.delimiter)
     elif args.command == "summarize":
         summarize(args.input, args.output)
     elif args.command == "visualize":